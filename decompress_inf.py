@@ -55,23 +55,177 @@ SECTION FORMAT (two variants):
    - child_sections
 """
 
+import io
+import sys
+import math
 import zlib
 import os
-import glob
+import mmap
 import struct
 import argparse
+import hashlib
+import contextlib
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
+
+# Precompiled little-endian readers for the hot parse paths
+_U32 = struct.Struct('<I')
+_F64 = struct.Struct('<d')
+_U16 = struct.Struct('<H')
+_U64 = struct.Struct('<Q')  # raw bit pattern of a double
+_PROP_HEADER = struct.Struct('<IB')  # name_idx + value count
+_ROOT_HEADER = struct.Struct('<II')  # object or simple-format section: prop_count + child_count
+_NODE_HEADER = struct.Struct('<III')  # child object or section header, see parse_tree
+_HEADER = struct.Struct('<III')  # compressed file: magic + compressed size + uncompressed size
+
+# Bound unpack_from methods, saving the attribute lookup in the innermost loops
+_unpack_u32 = _U32.unpack_from
+_unpack_u64 = _U64.unpack_from
+_unpack_prop_header = _PROP_HEADER.unpack_from
+_unpack_node_header = _NODE_HEADER.unpack_from
+
+# Multi-value properties made only of doubles (Position, Size, Color, ...)
+# are decoded with a single unpack: value count -> (type tags, Struct).
+# Values are read as raw bit patterns for BinaryInfParser.fmt_double_bits.
+_DOUBLE_RUNS = {}
+
+
+def _double_run(count):
+    """Get the type tags and Struct for a run of count tagged doubles."""
+    run = _DOUBLE_RUNS.get(count)
+    if run is None:
+        run = _DOUBLE_RUNS[count] = (b'\x01' * count, struct.Struct('<' + 'xQ' * count))
+    return run
+
+
+class _IndentCache(dict):
+    """Indented lines by nesting depth, built once instead of '\\t' * indent per object.
+
+    A dict rather than a fixed-size table, so any depth works.
+    """
+
+    def __init__(self, suffix=''):
+        super().__init__()
+        self.suffix = suffix
+
+    def __missing__(self, depth):
+        line = self[depth] = '\t' * depth + self.suffix
+        return line
+
+
+INDENTS = _IndentCache()
+OPEN_LINES = _IndentCache('{')  # Block braces, the most common lines after properties
+CLOSE_LINES = _IndentCache('}')
 
 # Magic values for binary INF versions (from Ghidra analysis at 0x006a4610)
-MAGICS = {
-    b'\xAA\xA5\xFF\xFF': 3,  # Version 3 (0xFFFFA5AA in LE)
-    b'\xAB\xA5\xFF\xFF': 2,  # Version 2
-    b'\xAC\xA5\xFF\xFF': 1,  # Version 1
-    b'\xAD\xA5\xFF\xFF': 0,  # Version 0
+# Keyed by the little-endian u32 so lookups compare ints instead of hashing bytes
+MAGICS_INT = {
+    0xFFFFA5AA: 3,  # Version 3 (AA A5 FF FF)
+    0xFFFFA5AB: 2,  # Version 2
+    0xFFFFA5AC: 1,  # Version 1
+    0xFFFFA5AD: 0,  # Version 0
 }
 
 def get_version(magic_bytes):
     """Get version number from magic bytes."""
-    return MAGICS.get(magic_bytes, None)
+    if len(magic_bytes) < 4:
+        return None
+    return MAGICS_INT.get(_U32.unpack_from(magic_bytes, 0)[0])
+
+
+def read_string_table(data, pos, count):
+    """Read up to count null-terminated UTF-8 strings starting at pos.
+
+    The table is split in a single bytes.split() call instead of one find()
+    per string. Stops early if the table is truncated.
+
+    Returns:
+        Tuple of (strings, position after the last terminator)
+    """
+    # maxsplit=count leaves the unterminated remainder as the last part
+    parts = data[pos:].split(b'\x00', count)
+    del parts[-1]
+    end = pos + len(parts) + sum(map(len, parts))
+    return [p.decode('utf-8', errors='replace') for p in parts], end
+
+
+def read_wstring_table(data, pos, count):
+    """Read up to count length-prefixed UTF-16LE strings starting at pos.
+
+    Each entry is a u32 char count followed by the UTF-16LE data. The payloads
+    are decoded together in one call and split by their char counts; if that is
+    not possible (surrogate pairs) each entry is decoded on its own. Invalid
+    UTF-16 is decoded with U+FFFD replacement characters.
+    Stops early if the table is truncated.
+    """
+    size = len(data)
+    unpack = _unpack_u32
+    spans = []  # (start, end) byte offsets of each payload
+    append = spans.append
+    try:
+        for _ in range(count):
+            start = pos + 4
+            pos = start + unpack(data, pos)[0] * 2  # struct.error if the count is cut off
+            if pos > size:
+                break
+            append((start, pos))
+    except struct.error:
+        pass
+    if not spans:
+        return []
+
+    # errors='replace' turns each unpaired surrogate into a single U+FFFD, so
+    # the decodes never raise and invalid data still keeps one char per code unit
+    view = memoryview(data)
+    text = b''.join([view[start:end] for start, end in spans]).decode('utf-16le', 'replace')
+    if len(text) * 2 == sum(end - start for start, end in spans):
+        # Every code unit is one character, so the char counts are offsets into text
+        wstrings = []
+        offset = 0
+        for start, end in spans:
+            stop = offset + (end - start) // 2
+            wstrings.append(text[offset:stop])
+            offset = stop
+        return wstrings
+
+    return [str(view[start:end], 'utf-16le', 'replace') for start, end in spans]
+
+
+# BinaryInfParser._layouts markers for a class not parsed yet and one parsed only once
+_UNSEEN = object()
+_SEEN_ONCE = object()
+
+# Frame kinds on the BinaryInfParser.parse_tree and TerrainTypeTableParser work stacks
+_SECTIONS = 0  # child sections of an object
+_OBJECTS = 1   # child objects of a container section
+
+
+class PropertyLayout:
+    """Fixed layout of a property block, decoded with a single Struct call.
+
+    The name_idx/count/type fields are read along with the values and compared
+    with the recorded layout; read() returns None if they differ, so a block is
+    only accepted when the generic parser would walk it exactly the same way.
+    """
+
+    def __init__(self, block_struct, checked, expected, props):
+        self.struct = block_struct
+        self.size = block_struct.size
+        self.get_checked = itemgetter(*checked)
+        self.expected = tuple(expected)
+        self.props = props  # (line prefix, [(formatter, value index), ...])
+        self.hits = 0  # blocks decoded with this layout
+
+    def read(self, data, pos):
+        """Return the property lines for the block at pos, or None if it does not match."""
+        try:
+            fields = self.struct.unpack_from(data, pos)
+        except struct.error:
+            return None
+        if self.get_checked(fields) != self.expected:
+            return None
+        return [prefix + ', '.join([fmt(fields[i]) for fmt, i in values])
+                for prefix, values in self.props]
 
 
 class BinaryInfParser:
@@ -84,6 +238,19 @@ class BinaryInfParser:
         self.wstrings = []
         self.refid_counter = 0  # Counter for generating _RefID values
         self._load_string_tables()
+        # Table indices of '_RefID', so skipped properties are found by an int lookup
+        self._refid_indices = frozenset(i for i, s in enumerate(self.strings) if s == '_RefID')
+        # Formatted values reused across the file
+        self._quoted_strings = [self.fmt_string(s) for s in self.strings]
+        self._quoted_wstrings = [f'L"{w}"' for w in self.wstrings]
+        self._fmt_cache = {}  # double bit pattern -> formatted text
+        self._layouts = {}  # (class name, prop_count) -> PropertyLayout or None
+        # Fixed-size value types, indexed by type tag: (unpack_from, size, formatter)
+        self._value_readers = (
+            (_unpack_u32, 4, self.fmt_str_idx),     # 0: string index
+            (_unpack_u64, 8, self.fmt_double_bits),  # 1: double, as bit pattern
+            (_unpack_u32, 4, self.fmt_wstr),        # 2: wide string index
+        )
 
     def next_refid(self):
         """Get next _RefID value and increment counter."""
@@ -92,73 +259,73 @@ class BinaryInfParser:
 
     def _load_string_tables(self):
         """Load string and wide string tables from the end of the file."""
-        sto = struct.unpack('<I', self.data[0:4])[0]
+        sto = _U32.unpack_from(self.data, 0)[0]
         if sto < 16 or sto >= len(self.data):
             raise ValueError(f"Invalid string table offset: {sto}")
 
         pos = sto
 
         # Read regular strings
-        str_count = struct.unpack('<I', self.data[pos:pos+4])[0]
-        pos += 4
-
-        for _ in range(str_count):
-            end = self.data.find(b'\x00', pos)
-            if end == -1:
-                break
-            self.strings.append(self.data[pos:end].decode('utf-8', errors='replace'))
-            pos = end + 1
+        str_count = _U32.unpack_from(self.data, pos)[0]
+        self.strings, pos = read_string_table(self.data, pos + 4, str_count)
 
         # Read wide strings (UTF-16LE)
         if pos + 8 <= len(self.data):
-            wstr_count = struct.unpack('<I', self.data[pos:pos+4])[0]
-            pos += 4
-
-            for _ in range(wstr_count):
-                if pos + 4 > len(self.data):
-                    break
-                char_count = struct.unpack('<I', self.data[pos:pos+4])[0]
-                pos += 4
-                byte_len = char_count * 2
-                if pos + byte_len > len(self.data):
-                    break
-                try:
-                    self.wstrings.append(self.data[pos:pos+byte_len].decode('utf-16le'))
-                except:
-                    self.wstrings.append(f'<wstring@{pos}>')
-                pos += byte_len
-
-    def u8(self):
-        val = self.data[self.pos]
-        self.pos += 1
-        return val
-
-    def u32(self):
-        val = struct.unpack('<I', self.data[self.pos:self.pos+4])[0]
-        self.pos += 4
-        return val
-
-    def f64(self):
-        val = struct.unpack('<d', self.data[self.pos:self.pos+8])[0]
-        self.pos += 8
-        return val
+            wstr_count = _U32.unpack_from(self.data, pos)[0]
+            self.wstrings = read_wstring_table(self.data, pos + 4, wstr_count)
 
+    # Indices are unsigned, so only indices past the end of a table can be invalid.
+    # Valid files never have those, so look up first and handle IndexError instead
+    # of bounds checking every access.
     def get_str(self, idx):
-        if 0 <= idx < len(self.strings):
+        try:
             return self.strings[idx]
-        return f'<string_{idx}>'
+        except IndexError:
+            return f'<string_{idx}>'
 
     def get_wstr(self, idx):
-        if 0 <= idx < len(self.wstrings):
+        try:
             return self.wstrings[idx]
-        return f'<wstring_{idx}>'
+        except IndexError:
+            return f'<wstring_{idx}>'
 
     def fmt_double(self, v):
-        """Format double value, showing integers without decimals."""
-        if v == int(v) and abs(v) < 1e15:
-            return str(int(v))
+        """Format double value, showing integers without decimals.
+
+        Raises ValueError for NaN and infinities, which the text format can't hold.
+        """
+        if -1e15 < v < 1e15:
+            # is_integer() avoids allocating an int just for the comparison
+            if v.is_integer():
+                return str(int(v))
+        elif not math.isfinite(v):
+            raise ValueError(f'Non-finite double {v}')
         return str(v)
 
+    def fmt_double_bits(self, bits):
+        """Format a double given its raw bit pattern, memoized per file.
+
+        INF files repeat the same few values (0, 1, -1, 255, ...) thousands of times.
+        """
+        text = self._fmt_cache.get(bits)
+        if text is None:
+            text = self._fmt_cache[bits] = self.fmt_double(_F64.unpack(_U64.pack(bits))[0])
+        return text
+
+    def fmt_str_idx(self, idx):
+        """Format a string table value."""
+        try:
+            return self._quoted_strings[idx]
+        except IndexError:
+            return self.fmt_string(self.get_str(idx))
+
+    def fmt_wstr(self, idx):
+        """Format a wide string value as L"..."."""
+        try:
+            return self._quoted_wstrings[idx]
+        except IndexError:
+            return f'L"{self.get_wstr(idx)}"'
+
     def needs_quotes(self, s):
         """Check if a string value needs quotes in the output."""
         # Empty strings always need quotes
@@ -176,8 +343,9 @@ class BinaryInfParser:
     def fmt_string(self, s):
         """Format a string value with quotes if needed."""
         if self.needs_quotes(s):
-            # Escape any quotes in the string
-            s = s.replace('"', '\\"')
+            # Escape any quotes in the string (rare, so check before copying)
+            if '"' in s:
+                s = s.replace('"', '\\"')
             return f'"{s}"'
         return s
 
@@ -186,105 +354,176 @@ class BinaryInfParser:
 
         Returns None if the property should be skipped (e.g., _RefID which we generate ourselves).
         """
-        name_idx = self.u32()
+        # Hot loop: work on locals and store the position back once
+        data = self.data
+        pos = self.pos
+        name_idx, count = _unpack_prop_header(data, pos)
+        pos += 5
         prop_name = self.get_str(name_idx)
-        count = self.u8()
+
+        if count == 1:
+            # Fast path: a single fixed-size value needs no value list or join
+            ptype = data[pos]
+            if ptype < 3:
+                unpack, size, fmt = self._value_readers[ptype]
+                try:
+                    val = fmt(unpack(data, pos + 1)[0])
+                except struct.error:
+                    self.pos = pos + 1  # Report the offset of the truncated value
+                    raise
+                self.pos = pos + 1 + size
+                if name_idx in self._refid_indices:
+                    return None
+                return f'{prop_name} = {val}'
+        elif count > 1:
+            # Fast path: every value is a double, type tags sit at a 9-byte stride
+            tags, run = _double_run(count)
+            if data[pos:pos + run.size:9] == tags:
+                fmt_double_bits = self.fmt_double_bits
+                vals = [fmt_double_bits(b) for b in run.unpack_from(data, pos)]
+                self.pos = pos + run.size
+                if name_idx in self._refid_indices:
+                    return None
+                return f'{prop_name} = {", ".join(vals)}'
 
         vals = []
-        for _ in range(count):
-            ptype = self.u8()
-            if ptype == 0:  # String index
-                idx = self.u32()
-                vals.append(self.fmt_string(self.get_str(idx)))
-            elif ptype == 1:  # Double
-                vals.append(self.fmt_double(self.f64()))
-            elif ptype == 2:  # Wide string index
-                idx = self.u32()
-                vals.append(f'L"{self.get_wstr(idx)}"')
-            elif ptype == 3:  # Blob
-                blob_len = self.u32()
-                self.pos += blob_len
-                vals.append(f'<blob:{blob_len}>')
-            else:
-                raise ValueError(f'Unknown property type {ptype} at 0x{self.pos-1:X}')
+        readers = self._value_readers
+        try:
+            for _ in range(count):
+                ptype = data[pos]
+                pos += 1
+                if ptype < 3:  # String index, double or wide string index
+                    unpack, size, fmt = readers[ptype]
+                    vals.append(fmt(unpack(data, pos)[0]))
+                    pos += size
+                elif ptype == 3:  # Blob
+                    blob_len = _unpack_u32(data, pos)[0]
+                    pos += 4 + blob_len
+                    vals.append(f'<blob:{blob_len}>')
+                else:
+                    raise ValueError(f'Unknown property type {ptype} at 0x{pos-1:X}')
+        finally:
+            # Also on errors, so parse() reports the failing offset
+            self.pos = pos
 
         # Skip _RefID properties - we generate these ourselves with proper sequential numbering
-        if prop_name == '_RefID':
+        if name_idx in self._refid_indices:
             return None
 
         return f'{prop_name} = {", ".join(vals)}'
 
-    def parse_root_object(self, indent=0):
-        """Parse the root object (no class_idx, uses strings[0])."""
-        lines = []
-        ind = '\t' * indent
-
-        prop_count = self.u32()
-        child_count = self.u32()
-        class_name = self.get_str(0)  # Root uses strings[0]
-
-        lines.append(f'{ind}[{class_name}]')
-        lines.append(f'{ind}{{')
+    def parse_properties(self, out, class_name, prop_count, prop_ind):
+        """Parse prop_count properties, appending text lines to out.
 
-        # Add _RefID as first property only for objects with class type (contains ' : ')
-        if ' : ' in class_name:
-            lines.append(f'{ind}\t_RefID = {self.next_refid()}')
-
-        # Parse properties
+        Objects of the same class usually repeat the same property layout, so the
+        layout of the second block seen for (class_name, prop_count) is recorded and
+        tried first; keys seen only once, like uniquely named sections, never pay
+        for recording. A layout that has matched before is kept when an instance
+        differs; one that never matched is dropped, so classes without a stable
+        layout stop paying for the attempt.
+        """
+        key = (class_name, prop_count)
+        layout = self._layouts.get(key, _UNSEEN)
+        if isinstance(layout, PropertyLayout):
+            lines = layout.read(self.data, self.pos)
+            if lines is not None:
+                layout.hits += 1
+                self.pos += layout.size
+                out.extend([prop_ind + line for line in lines])
+                return
+            if not layout.hits:
+                self._layouts[key] = None
+
+        start = self.pos
         for _ in range(prop_count):
             prop_line = self.parse_property()
             if prop_line is not None:  # Skip None (filtered properties like _RefID)
-                lines.append(f'{ind}\t{prop_line}')
+                out.append(prop_ind + prop_line)
+        if layout is _UNSEEN:
+            self._layouts[key] = _SEEN_ONCE
+        elif layout is _SEEN_ONCE:
+            self._layouts[key] = self._record_layout(start, prop_count)
 
-        # Add blank line after properties, before child sections
-        if prop_count > 0 or child_count > 0:
-            lines.append('')
-
-        # Parse child sections
-        for _ in range(child_count):
-            section_lines = self.parse_section(indent + 1)
-            lines.extend(section_lines)
+    def _record_layout(self, pos, prop_count):
+        """Describe the (already parsed) property block at pos as a PropertyLayout.
 
-        lines.append(f'{ind}}}')
-        return lines
-
-    def parse_child_object(self, indent=0):
-        """Parse a child object (has class_idx as first field)."""
-        lines = []
-        ind = '\t' * indent
-
-        class_idx = self.u32()  # Child objects have explicit class_idx
-        class_name = self.get_str(class_idx)
-        prop_count = self.u32()
-        child_count = self.u32()
+        Returns None if the block contains blobs, which have no fixed size.
+        """
+        fmt = ['<']
+        checked = []   # indices of name_idx/count/type fields in the unpacked tuple
+        expected = []  # their values in this block
+        props = []     # (line prefix, [(formatter, value index), ...]) per emitted property
+        readers = self._value_readers
+        field = 0
+        for _ in range(prop_count):
+            name_idx, count = _PROP_HEADER.unpack_from(self.data, pos)
+            pos += 5
+            fmt.append('IB')
+            checked += (field, field + 1)
+            expected += (name_idx, count)
+            field += 2
+            values = []
+            for _ in range(count):
+                ptype = self.data[pos]
+                if ptype == 1:
+                    fmt.append('BQ')  # doubles as bit patterns, see fmt_double_bits
+                    pos += 9
+                elif ptype == 0 or ptype == 2:
+                    fmt.append('BI')
+                    pos += 5
+                else:
+                    return None
+                checked.append(field)
+                expected.append(ptype)
+                values.append((readers[ptype][2], field + 1))
+                field += 2
+            if name_idx not in self._refid_indices:  # Generated by the parser, see parse_property
+                props.append((f'{self.get_str(name_idx)} = ', values))
+        return PropertyLayout(struct.Struct(''.join(fmt)), checked, expected, props)
+
+    def open_object(self, out, name, prop_count, indent, blank_line):
+        """Append an object's header and properties to out.
+
+        Shared by the root object, child objects and inline object sections, which
+        only differ in how their header is read and when the blank separator line
+        after the properties is emitted (blank_line). The child sections and the
+        closing brace are emitted by parse_tree.
+        """
+        ind = INDENTS[indent]
+        prop_ind = INDENTS[indent + 1]
 
-        lines.append(f'{ind}[{class_name}]')
-        lines.append(f'{ind}{{')
+        out.append(f'{ind}[{name}]')
+        out.append(OPEN_LINES[indent])
 
         # Add _RefID as first property only for objects with class type (contains ' : ')
-        if ' : ' in class_name:
-            lines.append(f'{ind}\t_RefID = {self.next_refid()}')
+        if ' : ' in name:
+            out.append(f'{prop_ind}_RefID = {self.next_refid()}')
 
         # Parse properties
-        for _ in range(prop_count):
-            prop_line = self.parse_property()
-            if prop_line is not None:  # Skip None (filtered properties like _RefID)
-                lines.append(f'{ind}\t{prop_line}')
+        if prop_count:
+            self.parse_properties(out, name, prop_count, prop_ind)
 
         # Add blank line after properties, before child sections
-        if prop_count > 0 or child_count > 0:
-            lines.append('')
+        if blank_line:
+            out.append('')
 
-        # Parse child sections
-        for _ in range(child_count):
-            section_lines = self.parse_section(indent + 1)
-            lines.extend(section_lines)
+    def parse_root_object(self, out, indent=0):
+        """Open the root object (no class_idx, uses strings[0]) and return its child section count."""
+        prop_count, child_count = _ROOT_HEADER.unpack_from(self.data, self.pos)
+        self.pos += 8
+        class_name = self.get_str(0)  # Root uses strings[0]
+        self.open_object(out, class_name, prop_count, indent,
+                         prop_count > 0 or child_count > 0)
+        return child_count
 
-        lines.append(f'{ind}}}')
-        return lines
+    def parse_tree(self, out):
+        """Parse the root object and everything below it, appending text lines to out.
 
-    def parse_section(self, indent=0):
-        """Parse a section and return as text lines.
+        The tree is walked with an explicit stack instead of recursion. Each frame
+        is [kind, remaining, indent] for the child sections of an object or the
+        objects of a container section; a node's block is opened when its header
+        is read and closed when its frame runs out. Deep files therefore cost no
+        Python call frames per level and cannot hit the recursion limit.
 
         There are two section formats:
         1. Container section (section_type = 0): Contains child objects with their own class_idx
@@ -292,59 +531,44 @@ class BinaryInfParser:
         2. Inline object section (section_type != 0): Properties embedded, class in section name
            Format: name_idx + prop_count + child_count + properties + child_sections
         """
-        lines = []
-        ind = '\t' * indent
-
-        name_idx = self.u32()
-        section_name = self.get_str(name_idx)
-        second_field = self.u32()
-
-        if second_field == 0:
-            # Container section with child objects
-            obj_count = self.u32()
-            lines.append(f'{ind}[{section_name}]')
-            lines.append(f'{ind}{{')
-
-            # Add blank line at start of section
-            lines.append('')
-
-            for _ in range(obj_count):
-                obj_lines = self.parse_child_object(indent + 1)
-                lines.extend(obj_lines)
-
-            lines.append(f'{ind}}}')
-        else:
-            # Inline object section - the section name includes class info
-            # Format: section_name + prop_count + child_count + props + sections
-            # Example: "ToolTip : cPrismToolTip" becomes [ToolTip : cPrismToolTip]
-            prop_count = second_field
-            child_count = self.u32()
-
-            lines.append(f'{ind}[{section_name}]')
-            lines.append(f'{ind}{{')
-
-            # Add _RefID as first property for inline objects with ' : ' in name
-            if ' : ' in section_name:
-                lines.append(f'{ind}\t_RefID = {self.next_refid()}')
-
-            # Parse properties
-            for _ in range(prop_count):
-                prop_line = self.parse_property()
-                if prop_line is not None:  # Skip None (filtered properties like _RefID)
-                    lines.append(f'{ind}\t{prop_line}')
-
-            # Add blank line after properties if there are child sections
-            if prop_count > 0 and child_count > 0:
-                lines.append('')
-
-            # Parse child sections
-            for _ in range(child_count):
-                section_lines = self.parse_section(indent + 1)
-                lines.extend(section_lines)
-
-            lines.append(f'{ind}}}')
-
-        return lines
+        data = self.data
+        get_str = self.get_str
+        open_object = self.open_object
+        append = out.append
+
+        stack = [[_SECTIONS, self.parse_root_object(out, 0), 1]]
+        while stack:
+            frame = stack[-1]
+            kind, remaining, indent = frame
+            if not remaining:
+                stack.pop()
+                append(CLOSE_LINES[indent - 1])
+                continue
+            frame[1] = remaining - 1
+
+            # Child objects (class_idx + prop_count + child_count) and sections
+            # (name_idx + second field + third field) share a 12-byte header
+            pos = self.pos
+            first, second, third = _unpack_node_header(data, pos)
+            self.pos = pos + 12
+            name = get_str(first)
+
+            if kind == _OBJECTS:
+                open_object(out, name, second, indent, second > 0 or third > 0)
+                stack.append([_SECTIONS, third, indent + 1])
+            elif second == 0:
+                # Container section with child objects, blank line at start of section
+                ind = INDENTS[indent]
+                append(f'{ind}[{name}]')
+                append(OPEN_LINES[indent])
+                append('')
+                stack.append([_OBJECTS, third, indent + 1])
+            else:
+                # Inline object section - the section name includes class info
+                # Example: "ToolTip : cPrismToolTip" becomes [ToolTip : cPrismToolTip]
+                # Blank line after properties only if there are child sections
+                open_object(out, name, second, indent, second > 0 and third > 0)
+                stack.append([_SECTIONS, third, indent + 1])
 
     def parse(self):
         """Parse the entire file and return text representation."""
@@ -352,9 +576,14 @@ class BinaryInfParser:
         self.pos = 16
 
         try:
-            lines = self.parse_root_object(0)
-            # Add leading blank line and trailing newline to match original format
-            return '\r\n' + '\r\n'.join(lines) + '\r\n'
+            # All parse methods append to this one list instead of building and
+            # merging a list per nesting level. Empty first and last lines give the
+            # leading blank line and trailing newline of the original format, so the
+            # text is assembled by one join without copying it again.
+            lines = ['']
+            self.parse_tree(lines)
+            lines.append('')
+            return '\r\n'.join(lines)
         except Exception as e:
             raise ValueError(f'Parse error at 0x{self.pos:X}: {e}')
 
@@ -381,19 +610,13 @@ class SimpleInfParser:
 
     def _load_strings(self):
         """Load string table."""
-        sto = struct.unpack('<I', self.data[0:4])[0]
+        sto = _U32.unpack_from(self.data, 0)[0]
         pos = sto
-        str_count = struct.unpack('<I', self.data[pos:pos+4])[0]
-        pos += 4
-        for _ in range(str_count):
-            end = self.data.find(b'\x00', pos)
-            if end == -1:
-                break
-            self.strings.append(self.data[pos:end].decode('utf-8', errors='replace'))
-            pos = end + 1
+        str_count = _U32.unpack_from(self.data, pos)[0]
+        self.strings, _ = read_string_table(self.data, pos + 4, str_count)
 
     def u32(self):
-        val = struct.unpack('<I', self.data[self.pos:self.pos+4])[0]
+        val = _U32.unpack_from(self.data, self.pos)[0]
         self.pos += 4
         return val
 
@@ -425,7 +648,7 @@ class SimpleInfParser:
                     vidx = self.u32()
                     values.append(self.get_str(vidx))
                 elif vtype == 1:  # double
-                    val = struct.unpack('<d', self.data[self.pos:self.pos+8])[0]
+                    val = _F64.unpack_from(self.data, self.pos)[0]
                     self.pos += 8
                     values.append(val)
 
@@ -440,23 +663,27 @@ class SimpleInfParser:
                 return f'"{val}"'
             return val
         else:
+            if not math.isfinite(val):
+                raise ValueError(f'Non-finite double {val}')
             # Format numbers without trailing zeros
-            if val == int(val):
+            if val.is_integer():
                 return str(int(val))
             else:
                 return str(val)
 
-    def parse_section(self, name, indent=0):
-        """Parse a section with its properties and child sections recursively."""
-        lines = []
-        ind = '\t' * indent
+    def open_section(self, lines, name, indent):
+        """Append a section's header and properties to lines.
 
-        prop_count = self.u32()
-        child_count = self.u32()
+        Returns the parse_section stack frame for its child sections.
+        """
+        ind = INDENTS[indent]
+
+        prop_count, child_count = _ROOT_HEADER.unpack_from(self.data, self.pos)
+        self.pos += 8
 
         # Format section header
         lines.append(f'{ind}[{name}]')
-        lines.append(f'{ind}{{')
+        lines.append(OPEN_LINES[indent])
 
         # Parse and format properties
         props = self.parse_properties(prop_count)
@@ -468,18 +695,30 @@ class SimpleInfParser:
                 formatted = ','.join(self.format_value(v) for v in values)
                 lines.append(f'{ind}\t{pname}={formatted}')
 
-        # Parse child sections recursively
-        for _ in range(child_count):
+        return [child_count, bool(props), indent]
+
+    def parse_section(self, lines, name, indent=0):
+        """Parse a section with its properties and child sections, appending text lines to lines.
+
+        Child sections are walked with an explicit stack of
+        [remaining children, has properties, indent] frames instead of recursion.
+        """
+        stack = [self.open_section(lines, name, indent)]
+        while stack:
+            frame = stack[-1]
+            remaining, has_props, indent = frame
+            if not remaining:
+                stack.pop()
+                lines.append(CLOSE_LINES[indent])
+                continue
+            frame[0] = remaining - 1
+
             name_idx = self.u32()
             child_name = self.get_str(name_idx)
             # Add blank line before child section if we had properties
-            if props:
+            if has_props:
                 lines.append('')
-            child_lines = self.parse_section(child_name, indent + 1)
-            lines.extend(child_lines)
-
-        lines.append(f'{ind}}}')
-        return lines
+            stack.append(self.open_section(lines, child_name, indent + 1))
 
     def parse(self):
         """Parse the entire file and return text representation."""
@@ -492,18 +731,17 @@ class SimpleInfParser:
 
         # Section 0: name is strings[0], no name_idx field before prop_count
         name = self.get_str(0)
-        section_lines = self.parse_section(name, 0)
-        all_lines.extend(section_lines)
+        self.parse_section(all_lines, name, 0)
 
         # Remaining top-level sections: have name_idx field
         for _ in range(1, section_count):
             name_idx = self.u32()
             name = self.get_str(name_idx)
             all_lines.append('')  # Blank line between top-level sections
-            section_lines = self.parse_section(name, 0)
-            all_lines.extend(section_lines)
+            self.parse_section(all_lines, name, 0)
 
-        return '\r\n'.join(all_lines) + '\r\n'
+        all_lines.append('')  # Trailing newline
+        return '\r\n'.join(all_lines)
 
 
 class TerrainTypeTableParser:
@@ -522,19 +760,15 @@ class TerrainTypeTableParser:
         self.pos = 0
         self.strings = []
         self._load_strings()
+        # Quoted form of each string value, built once per table entry
+        self._quoted_strings = [self.fmt_string(s) for s in self.strings]
 
     def _load_strings(self):
         """Load string table."""
-        sto = struct.unpack('<I', self.data[0:4])[0]
+        sto = _U32.unpack_from(self.data, 0)[0]
         pos = sto
-        str_count = struct.unpack('<I', self.data[pos:pos+4])[0]
-        pos += 4
-        for _ in range(str_count):
-            end = self.data.find(b'\x00', pos)
-            if end == -1:
-                break
-            self.strings.append(self.data[pos:end].decode('utf-8', errors='replace'))
-            pos = end + 1
+        str_count = _U32.unpack_from(self.data, pos)[0]
+        self.strings, _ = read_string_table(self.data, pos + 4, str_count)
 
     def u8(self):
         val = self.data[self.pos]
@@ -542,17 +776,17 @@ class TerrainTypeTableParser:
         return val
 
     def u16(self):
-        val = struct.unpack('<H', self.data[self.pos:self.pos+2])[0]
+        val = _U16.unpack_from(self.data, self.pos)[0]
         self.pos += 2
         return val
 
     def u32(self):
-        val = struct.unpack('<I', self.data[self.pos:self.pos+4])[0]
+        val = _U32.unpack_from(self.data, self.pos)[0]
         self.pos += 4
         return val
 
     def f64(self):
-        val = struct.unpack('<d', self.data[self.pos:self.pos+8])[0]
+        val = _F64.unpack_from(self.data, self.pos)[0]
         self.pos += 8
         return val
 
@@ -563,15 +797,26 @@ class TerrainTypeTableParser:
 
     def fmt_double(self, v):
         """Format double value."""
-        if v == int(v) and abs(v) < 1e15:
-            return str(int(v))
+        if -1e15 < v < 1e15:
+            if v.is_integer():
+                return str(int(v))
+        elif not math.isfinite(v):
+            raise ValueError(f'Non-finite double {v}')
         return str(v)
 
     def fmt_string(self, s):
         """Format string value with quotes."""
-        s = s.replace('"', '\\"')
+        if '"' in s:
+            s = s.replace('"', '\\"')
         return f'"{s}"'
 
+    def fmt_str_idx(self, idx):
+        """Format a string table value."""
+        try:
+            return self._quoted_strings[idx]
+        except IndexError:
+            return self.fmt_string(self.get_str(idx))
+
     def parse_property(self):
         """Parse a property in standard u32 format."""
         name_idx = self.u32()
@@ -586,8 +831,7 @@ class TerrainTypeTableParser:
                 vtype = first_type
 
             if vtype == 0:  # String
-                idx = self.u32()
-                vals.append(self.fmt_string(self.get_str(idx)))
+                vals.append(self.fmt_str_idx(self.u32()))
             elif vtype == 1:  # Double
                 vals.append(self.fmt_double(self.f64()))
             elif vtype == 2:  # Wide string (not expected here)
@@ -598,18 +842,16 @@ class TerrainTypeTableParser:
 
         return self.get_str(name_idx), vals
 
-    def parse_child_object(self, indent=1):
-        """Parse a child object in standard u32 format."""
-        lines = []
-        ind = '\t' * indent
+    def open_child_object(self, lines, indent):
+        """Append a child object's header and properties to lines; returns its section count."""
+        ind = INDENTS[indent]
 
-        class_idx = self.u32()
-        prop_count = self.u32()
-        sec_count = self.u32()
+        class_idx, prop_count, sec_count = _NODE_HEADER.unpack_from(self.data, self.pos)
+        self.pos += 12
 
         class_name = self.get_str(class_idx)
         lines.append(f'{ind}[{class_name}]')
-        lines.append(f'{ind}{{')
+        lines.append(OPEN_LINES[indent])
 
         # Properties
         for _ in range(prop_count):
@@ -620,26 +862,40 @@ class TerrainTypeTableParser:
         # Blank line before sections if we had properties
         if prop_count > 0 and sec_count > 0:
             lines.append('')
+        return sec_count
+
+    def parse_child_object(self, lines, indent=1):
+        """Parse a child object in standard u32 format, appending text lines to lines.
 
-        # Child sections (container sections)
-        for _ in range(sec_count):
-            sec_name_idx = self.u32()
-            sec_zero = self.u32()
-            sec_children = self.u32()
+        Nested container sections and their child objects are walked with an
+        explicit stack of [kind, remaining, indent] frames, as in
+        BinaryInfParser.parse_tree.
+        """
+        stack = [[_SECTIONS, self.open_child_object(lines, indent), indent + 1]]
+        while stack:
+            frame = stack[-1]
+            kind, remaining, indent = frame
+            if not remaining:
+                stack.pop()
+                lines.append(CLOSE_LINES[indent - 1])
+                continue
+            frame[1] = remaining - 1
+
+            if kind == _OBJECTS:
+                stack.append([_SECTIONS, self.open_child_object(lines, indent), indent + 1])
+                continue
+
+            # Child sections (container sections)
+            ind = INDENTS[indent]
+            sec_name_idx, sec_zero, sec_children = _NODE_HEADER.unpack_from(self.data, self.pos)
+            self.pos += 12
 
             sec_name = self.get_str(sec_name_idx)
-            lines.append(f'{ind}\t[{sec_name}]')
-            lines.append(f'{ind}\t{{')
+            lines.append(f'{ind}[{sec_name}]')
+            lines.append(OPEN_LINES[indent])
 
             # Container sections have child objects
-            for _ in range(sec_children):
-                child_lines = self.parse_child_object(indent + 2)
-                lines.extend(child_lines)
-
-            lines.append(f'{ind}\t}}')
-
-        lines.append(f'{ind}}}')
-        return lines
+            stack.append([_OBJECTS, sec_children, indent + 1])
 
     def parse(self):
         """Parse the entire file and return text representation."""
@@ -667,7 +923,7 @@ class TerrainTypeTableParser:
         if prop_val == 0:
             prop_val_str = '""'
         else:
-            prop_val_str = self.fmt_string(self.get_str(prop_val))
+            prop_val_str = self.fmt_str_idx(prop_val)
         lines.append(f'{prop_name} = {prop_val_str}')
         lines.append('')
 
@@ -684,8 +940,7 @@ class TerrainTypeTableParser:
 
         # Child objects (standard u32 format)
         for _ in range(child_count):
-            child_lines = self.parse_child_object(1)
-            lines.extend(child_lines)
+            self.parse_child_object(lines, 1)
 
         lines.append('}')
         lines.append('')
@@ -706,20 +961,20 @@ def is_terraintypetable_format(data):
     if len(data) < 0x22:
         return False
 
-    sto = struct.unpack('<I', data[0:4])[0]
+    sto = _U32.unpack_from(data, 0)[0]
     if sto < 0x22 or sto >= len(data):
         return False
 
     # Check header pattern: 01 00 00 00 01 00 00 00 00 00 00 00 at 0x04
-    val_04 = struct.unpack('<I', data[4:8])[0]
-    val_08 = struct.unpack('<I', data[8:12])[0]
-    val_0c = struct.unpack('<I', data[12:16])[0]
+    val_04 = _U32.unpack_from(data, 4)[0]
+    val_08 = _U32.unpack_from(data, 8)[0]
+    val_0c = _U32.unpack_from(data, 12)[0]
 
     if val_04 != 1 or val_08 != 1 or val_0c != 0:
         return False
 
     # Check first string is 'StringID'
-    str_count = struct.unpack('<I', data[sto:sto+4])[0]
+    str_count = _U32.unpack_from(data, sto)[0]
     if str_count < 3:
         return False
 
@@ -743,17 +998,17 @@ def is_tdx_defs_format(data):
     if len(data) < 24:
         return False
 
-    sto = struct.unpack('<I', data[0:4])[0]
+    sto = _U32.unpack_from(data, 0)[0]
     if sto < 16 or sto >= len(data):
         return False
 
     # Check for non-zero entry count at 0x04
-    entry_count = struct.unpack('<I', data[4:8])[0]
+    entry_count = _U32.unpack_from(data, 4)[0]
     if entry_count == 0:
         return False
 
     # Read first string
-    str_count = struct.unpack('<I', data[sto:sto+4])[0]
+    str_count = _U32.unpack_from(data, sto)[0]
     if str_count == 0:
         return False
     pos = sto + 4
@@ -790,13 +1045,13 @@ def is_simple_format(data):
     """
     if len(data) < 24:
         return False
-    sto = struct.unpack('<I', data[0:4])[0]
+    sto = _U32.unpack_from(data, 0)[0]
     if sto < 16 or sto >= len(data):
         return False
 
     # Check structural indicators
-    val_08 = struct.unpack('<I', data[8:12])[0]   # section_count or 1
-    val_14 = struct.unpack('<I', data[20:24])[0]  # child_count at offset 0x14
+    val_08 = _U32.unpack_from(data, 8)[0]   # section_count or 1
+    val_14 = _U32.unpack_from(data, 20)[0]  # child_count at offset 0x14
 
     # Simple format has section_count > 1 at offset 8, and child_count = 0 at offset 0x14
     # Object format has 1 at offset 8 and often child_count > 0
@@ -804,7 +1059,7 @@ def is_simple_format(data):
         return True
 
     # Additional check: object format first string often contains ' : '
-    str_count = struct.unpack('<I', data[sto:sto+4])[0]
+    str_count = _U32.unpack_from(data, sto)[0]
     if str_count == 0:
         return False
     pos = sto + 4
@@ -832,12 +1087,12 @@ def is_version2_format(data):
         return False
 
     # Version 2 has non-zero value at 0x0C-0x0F while v3 has zeros
-    val_0c = struct.unpack('<I', data[12:16])[0]
+    val_0c = _U32.unpack_from(data, 12)[0]
     if val_0c == 0:
         return False
 
     # Additional check: in v2, bytes at 0x0E are non-zero (often 0x0A)
-    val_0e = struct.unpack('<H', data[14:16])[0]
+    val_0e = _U16.unpack_from(data, 14)[0]
     return val_0e > 0
 
 
@@ -870,41 +1125,65 @@ def binary_to_text(data, compression_version=3):
         parser = BinaryInfParser(data)
     return parser.parse()
 
-def is_text_inf(data):
-    """Check if data is a text INF file (not binary)."""
+# Byte classes for checking ASCII text without decoding it (see is_text_inf)
+_ASCII_BYTES = bytes(range(128))
+_ASCII_WHITESPACE = b' \t\n\x0b\x0c\r\x1c\x1d\x1e\x1f'  # what str.strip() removes
+_PRINTABLE_ASCII = bytes(range(0x20, 0x7F)) + b'\r\n\t'
+_TEXT_WHITESPACE = str.maketrans('', '', '\r\n\t')  # allowed besides printable characters
+
+def is_text_inf(data, header=None):
+    """Check if data is a text INF file (not binary).
+
+    Args:
+        data: File content
+        header: The first u32 values of data if already read (see _HEADER), optional
+    """
     # Binary INF starts with string table offset (small number) followed by nulls
     # Text INF is human-readable with sections like [ClassName] and properties
     if len(data) < 4:
         return False
 
-    # Check for compressed magic
-    if data[0:4] in MAGICS:
+    if header is None:
+        header = (_U32.unpack_from(data, 0)[0],
+                  _U32.unpack_from(data, 4)[0] if len(data) >= 8 else None)
+
+    # Check for compressed magic (otherwise the first u32 is a string table offset)
+    sto = header[0]
+    if sto in MAGICS_INT:
         return False
 
     # Check if it looks like binary INF structure
     # Binary: first 4 bytes are string table offset (usually > 0x10 and < file size)
-    sto = struct.unpack('<I', data[0:4])[0]
-    if 16 <= sto < len(data) and data[4:8] == b'\x00\x00\x00\x00':
+    if 16 <= sto < len(data) and header[1] == 0:
         return False  # Likely binary INF
 
-    # Try to decode as text
-    try:
-        text = data[:500].decode('utf-8', errors='strict')
+    head = data[:500]
+    if not head.translate(None, _ASCII_BYTES):
+        # Pure ASCII (the usual case): check the raw bytes without decoding
         # Text INF should have section markers and be mostly printable
-        if '[' in text and ']' in text and '{' in text:
+        if b'[' in head and b']' in head and b'{' in head:
             return True
         # Or start with comment/section
-        stripped = text.strip()
-        if stripped.startswith('[') or stripped.startswith(';') or stripped.startswith('#'):
+        if head.strip(_ASCII_WHITESPACE)[:1] in (b'[', b';', b'#'):
             return True
         # Plain text file (like IntroDesc.inf which just contains a path)
-        # Check if all characters are printable ASCII or common whitespace
-        if all(c.isprintable() or c in '\r\n\t' for c in text):
-            return True
-    except:
-        pass
+        return not head.translate(None, _PRINTABLE_ASCII)
 
-    return False
+    # Try to decode as text
+    try:
+        text = head.decode('utf-8', errors='strict')
+    except UnicodeDecodeError:
+        return False
+    # Text INF should have section markers and be mostly printable
+    if '[' in text and ']' in text and '{' in text:
+        return True
+    # Or start with comment/section
+    stripped = text.strip()
+    if stripped.startswith('[') or stripped.startswith(';') or stripped.startswith('#'):
+        return True
+    # Plain text file (like IntroDesc.inf which just contains a path)
+    # Check if all characters are printable or common whitespace, in one C-level pass
+    return text.translate(_TEXT_WHITESPACE).isprintable()
 
 def analyze_binary_inf(data):
     """Analyze decompressed binary INF structure."""
@@ -913,32 +1192,149 @@ def analyze_binary_inf(data):
 
     info = {}
     info['size'] = len(data)
-    info['string_table_offset'] = struct.unpack('<I', data[0:4])[0]
+    info['string_table_offset'] = _U32.unpack_from(data, 0)[0]
 
     # Analyze string table
     sto = info['string_table_offset']
     if 16 <= sto < len(data) - 4:
-        info['string_count'] = struct.unpack('<I', data[sto:sto+4])[0]
+        info['string_count'] = _U32.unpack_from(data, sto)[0]
 
         # Read first few strings
-        strings = []
-        pos = sto + 4
-        for i in range(min(info['string_count'], 20)):
-            if pos >= len(data):
-                break
-            end = data.find(b'\x00', pos)
-            if end == -1:
-                break
-            try:
-                s = data[pos:end].decode('utf-8', errors='replace')
-                strings.append(s)
-            except:
-                strings.append(f'<binary@{pos}>')
-            pos = end + 1
+        strings, _ = read_string_table(data, sto + 4, min(info['string_count'], 20))
         info['sample_strings'] = strings
 
     return info
 
+# Binary mode on Windows; text-mode translation would corrupt CRLF output
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+_COMPARE_CHUNK = 1 << 20
+
+def has_content(path, data):
+    """Check if the file at path already contains exactly data."""
+    try:
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size != len(data):
+                return False
+            if not size:
+                return True  # Empty files cannot be mapped
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as existing:
+                # Compare bytes slices chunk by chunk: memcmp on the copies is several times
+                # faster than comparing memoryviews or hashing both sides with zlib.crc32,
+                # and the chunks bound the extra memory
+                for start in range(0, size, _COMPARE_CHUNK):
+                    end = start + _COMPARE_CHUNK
+                    if existing[start:end] != data[start:end]:
+                        return False
+                return True
+    except OSError:
+        return False
+
+def write_file(path, data):
+    """Write data to path with raw os.write() calls, bypassing Python's buffered file layer.
+
+    Nothing is written if the file already has this content, so re-running over
+    an unchanged tree (or converting in place) does no writes.
+    """
+    if has_content(path, data):
+        return
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            # os.write may write less than requested for large buffers
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def is_zlib_header(data):
+    """Check if data starts with a valid zlib stream header (RFC 1950)."""
+    if len(data) < 2:
+        return False
+    cmf, flg = data[0], data[1]
+    # Deflate compression method, and the check bits make the header a multiple of 31
+    return cmf & 0x0F == 8 and (cmf << 8 | flg) % 31 == 0
+
+
+def read_inf(input_path, verbose=False):
+    """Read an INF file, decompressing it if needed.
+
+    The file is memory-mapped, so zlib reads the compressed payload straight from
+    the page cache instead of a full copy of the file. The map is closed before
+    returning, so callers may overwrite input_path (in-place mode).
+
+    Returns:
+        Tuple of (kind, data, version, file_size) where kind is 'text' (data is the
+        file content), 'binary' (data is decompressed binary), None (skipped) or
+        False (decompression failed)
+    """
+    with open(input_path, 'rb') as f:
+        file_size = os.fstat(f.fileno()).st_size
+        if file_size < 12:
+            if verbose:
+                print(f"  Skipping {input_path} - too small")
+            return None, None, None, file_size
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            # Read the 12-byte header once: magic (or string table offset) + sizes
+            header = _HEADER.unpack_from(data, 0)
+            magic, compressed_size, uncompressed_size = header
+
+            # Check magic signature first: compressed files never need the text check
+            version = MAGICS_INT.get(magic)
+
+            # Check for text INF
+            if version is None and is_text_inf(data, header):
+                return 'text', data[:], None, file_size
+
+            if version is None:
+                # Check if already decompressed binary (first u32 is the string table offset)
+                if 16 <= magic < file_size:
+                    if verbose:
+                        print(f"  Processing {input_path} - already decompressed binary")
+                    return 'binary', data[:], None, file_size
+                if verbose:
+                    print(f"  Skipping {input_path} - unknown format (magic: {data[0:4].hex()})")
+                return None, None, None, file_size
+
+            if verbose:
+                print(f"  Version: {version}, Compressed: {compressed_size}, Uncompressed: {uncompressed_size}")
+
+            # Decompress (skip 12-byte header) from a view, without copying the payload
+            compressed_data = memoryview(data)[12:]
+            try:
+                # Size the output buffer from the header so zlib does not have to grow it.
+                # Deflate cannot expand more than ~1032:1, which bounds corrupt headers.
+                # One call inflating into that buffer beats streaming chunks through a
+                # decompressobj, which would copy every piece into the output again.
+                bufsize = min(uncompressed_size, len(compressed_data) * 1032) or zlib.DEF_BUF_SIZE
+
+                # Try the variant the stream header points to first: standard zlib
+                # or raw deflate. Data after the end of the stream is ignored, so
+                # slicing the payload to compressed_size would not change the result.
+                if is_zlib_header(compressed_data):
+                    attempts = (zlib.MAX_WBITS, -15)
+                else:
+                    attempts = (-15, zlib.MAX_WBITS)
+                error = None
+                for wbits in attempts:
+                    try:
+                        decompressed = zlib.decompress(compressed_data, wbits, bufsize)
+                        break
+                    except zlib.error as e:
+                        # Report why it is not a zlib stream rather than the raw deflate error
+                        if error is None or wbits == zlib.MAX_WBITS:
+                            error = e
+                else:
+                    print(f"  Error decompressing {input_path}: {error}")
+                    return False, None, version, file_size
+            finally:
+                # The map cannot be closed while a view of it is alive
+                compressed_data.release()
+
+    return 'binary', decompressed, version, file_size
+
 def decompress_inf(input_path, output_path, verbose=False, to_text=False):
     """Decompress a .inf file using the custom format.
 
@@ -948,96 +1344,47 @@ def decompress_inf(input_path, output_path, verbose=False, to_text=False):
         verbose: Show detailed output
         to_text: Convert binary INF to text format
     """
-    with open(input_path, 'rb') as f:
-        data = f.read()
-
-    if len(data) < 12:
-        if verbose:
-            print(f"  Skipping {input_path} - too small")
-        return None
+    kind, decompressed, version, input_size = read_inf(input_path, verbose)
+    if not kind:
+        return kind
 
-    # Check for text INF
-    if is_text_inf(data):
+    if kind == 'text':
         if verbose:
             print(f"  Skipping {input_path} - text format")
         # Copy text file to output
         if output_path:
-            with open(output_path, 'wb') as f:
-                f.write(data)
+            write_file(output_path, decompressed)
         return 'text'
 
-    # Check magic signature
-    magic = data[0:4]
-    version = get_version(magic)
-    decompressed = None
-
-    if version is None:
-        # Check if already decompressed binary
-        sto = struct.unpack('<I', data[0:4])[0]
-        if 16 <= sto < len(data):
-            if verbose:
-                print(f"  Processing {input_path} - already decompressed binary")
-            decompressed = data
-        else:
-            if verbose:
-                print(f"  Skipping {input_path} - unknown format (magic: {magic.hex()})")
-            return None
-    else:
-        # Read header
-        compressed_size = struct.unpack('<I', data[4:8])[0]
-        uncompressed_size = struct.unpack('<I', data[8:12])[0]
-
-        if verbose:
-            print(f"  Version: {version}, Compressed: {compressed_size}, Uncompressed: {uncompressed_size}")
-
-        # Decompress (skip 12-byte header)
-        compressed_data = data[12:]
-
-        try:
-            # Try standard zlib
-            decompressed = zlib.decompress(compressed_data)
-        except zlib.error:
-            try:
-                # Try raw deflate
-                decompressed = zlib.decompress(compressed_data, -15)
-            except zlib.error:
-                try:
-                    # Try with explicit size
-                    decompressed = zlib.decompress(compressed_data[:compressed_size])
-                except Exception as e:
-                    print(f"  Error decompressing {input_path}: {e}")
-                    return False
-
     # Convert to text if requested
     if to_text and decompressed:
         try:
             text_content = binary_to_text(decompressed, version if version is not None else 3)
+            char_count = len(text_content)
             if output_path:
-                # Use binary mode to preserve exact CRLF line endings
-                with open(output_path, 'wb') as f:
-                    f.write(text_content.encode('utf-8'))
-            print(f"  Converted: {os.path.basename(input_path)} -> text ({len(text_content)} chars)")
+                # Write raw bytes to preserve exact CRLF line endings. Rebinding drops the
+                # str as soon as it is encoded, so only one copy of the text is kept.
+                text_content = text_content.encode('utf-8')
+                write_file(output_path, text_content)
+            print(f"  Converted: {os.path.basename(input_path)} -> text ({char_count} chars)")
             return 'converted'
         except ValueError as e:
             # Format not supported for text conversion (e.g., TDX defs)
             if verbose:
                 print(f"  Skipping {input_path} - {e}")
             if output_path:
-                with open(output_path, 'wb') as f:
-                    f.write(decompressed)
+                write_file(output_path, decompressed)
             return 'binary'
         except Exception as e:
             print(f"  Error converting {input_path} to text: {e}")
             # Fall back to writing binary
             if output_path:
-                with open(output_path, 'wb') as f:
-                    f.write(decompressed)
+                write_file(output_path, decompressed)
             return 'binary'
 
     # Write decompressed binary data
     if output_path:
-        with open(output_path, 'wb') as f:
-            f.write(decompressed)
+        write_file(output_path, decompressed)
 
     if verbose:
         info = analyze_binary_inf(decompressed)
@@ -1046,9 +1393,81 @@ def decompress_inf(input_path, output_path, verbose=False, to_text=False):
             if 'sample_strings' in info and info['sample_strings']:
                 print(f"  Sample: {info['sample_strings'][:5]}")
 
-    print(f"  Decompressed: {os.path.basename(input_path)} ({len(data)} -> {len(decompressed)} bytes)")
+    print(f"  Decompressed: {os.path.basename(input_path)} ({input_size} -> {len(decompressed)} bytes)")
     return True
 
+def find_inf_files(root):
+    """Find all .inf and .base files below root in a single directory walk.
+
+    Matches what recursive glob patterns would: names starting with a dot are
+    skipped (files and directories), and the extension comparison follows the
+    platform's case rules.
+
+    Returns:
+        Tuple of (inf_files, base_files)
+    """
+    inf_files = []
+    base_files = []
+    # Recursive glob follows symlinked directories too
+    for dirpath, dirnames, filenames in os.walk(root, followlinks=True):
+        dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+        for name in filenames:
+            if name.startswith('.'):
+                continue
+            ext = os.path.splitext(os.path.normcase(name))[1]
+            if ext == '.inf':
+                inf_files.append(os.path.join(dirpath, name))
+            elif ext == '.base':
+                base_files.append(os.path.join(dirpath, name))
+    return inf_files, base_files
+
+
+_MAX_WINDOWS_WORKERS = 61  # WaitForMultipleObjects limit, minus the executor's own handles
+
+def _process_file(task):
+    """Run decompress_inf for process_directory in a worker process.
+
+    Returns:
+        Tuple of (decompress_inf result, text it printed)
+    """
+    input_path, output_path, verbose, to_text = task
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = decompress_inf(input_path, output_path, verbose=verbose, to_text=to_text)
+    return result, output.getvalue()
+
+
+def find_duplicates(paths):
+    """Map each path whose contents repeat an earlier path's to that earlier path.
+
+    Only files sharing a size are read and hashed, so trees without
+    duplicates cost one stat per file.
+    """
+    by_size = {}
+    for path in paths:
+        try:
+            by_size.setdefault(os.path.getsize(path), []).append(path)
+        except OSError:
+            pass
+
+    duplicates = {}
+    for group in by_size.values():
+        if len(group) < 2:
+            continue
+        seen = {}
+        for path in group:
+            try:
+                with open(path, 'rb') as f:
+                    digest = hashlib.blake2b(f.read(), digest_size=16).digest()
+            except OSError:
+                continue
+            if digest in seen:
+                duplicates[path] = seen[digest]
+            else:
+                seen[digest] = path
+    return duplicates
+
+
 def process_directory(input_dir, output_dir, verbose=False, in_place=False, to_text=False):
     """Process all INF and BASE files in a directory."""
     if in_place:
@@ -1057,8 +1476,7 @@ def process_directory(input_dir, output_dir, verbose=False, in_place=False, to_t
     os.makedirs(output_dir, exist_ok=True)
 
     # Find both .inf and .base files
-    inf_files = glob.glob(os.path.join(input_dir, "**/*.inf"), recursive=True)
-    base_files = glob.glob(os.path.join(input_dir, "**/*.base"), recursive=True)
+    inf_files, base_files = find_inf_files(input_dir)
     all_files = inf_files + base_files
     print(f"Found {len(inf_files)} .inf files and {len(base_files)} .base files")
     print(f"Output: {output_dir}")
@@ -1068,12 +1486,69 @@ def process_directory(input_dir, output_dir, verbose=False, in_place=False, to_t
 
     stats = {'decompressed': 0, 'converted': 0, 'text': 0, 'binary': 0, 'error': 0, 'skipped': 0}
 
+    # Identical files produce identical output, so each distinct file is only
+    # converted once and its output copied for the duplicates
+    duplicates = find_duplicates(all_files)
+
+    # Create output directories up front so the workers only read, convert and write.
+    # Many files share a directory, so each one is created only once.
+    tasks = []
+    duplicate_tasks = []
+    output_paths = {}
+    created_dirs = set()
     for inf_file in all_files:
         rel_path = os.path.relpath(inf_file, input_dir)
         output_path = os.path.join(output_dir, rel_path)
-        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
-
-        result = decompress_inf(inf_file, output_path, verbose=verbose, to_text=to_text)
+        out_dir = os.path.dirname(output_path) or '.'
+        if out_dir not in created_dirs:
+            os.makedirs(out_dir, exist_ok=True)
+            created_dirs.add(out_dir)
+        output_paths[inf_file] = output_path
+        if inf_file in duplicates:
+            duplicate_tasks.append((inf_file, output_path))
+        else:
+            tasks.append((inf_file, output_path))
+
+    # Files are independent and parsing is CPU-bound Python, so convert them in
+    # worker processes. Each worker returns its messages, which are printed here
+    # so the output of different files does not interleave.
+    results = []
+    if tasks:
+        workers = min(len(tasks), os.cpu_count() or 1)
+        if sys.platform == 'win32':
+            # ProcessPoolExecutor rejects an explicit max_workers above this on Windows
+            workers = min(workers, _MAX_WINDOWS_WORKERS)
+        if workers == 1:
+            # A single file or CPU gains nothing from starting a worker process
+            for inf_file, output_path in tasks:
+                results.append(decompress_inf(inf_file, output_path, verbose=verbose, to_text=to_text))
+        else:
+            # Hand out several small files per round trip to the workers
+            chunksize = max(1, len(tasks) // (workers * 4))
+            with ProcessPoolExecutor(workers) as executor:
+                for result, output in executor.map(
+                        _process_file, [(inf_file, output_path, verbose, to_text) for inf_file, output_path in tasks],
+                        chunksize=chunksize):
+                    sys.stdout.write(output)
+                    results.append(result)
+
+    file_results = {task[0]: result for task, result in zip(tasks, results)}
+    for inf_file, output_path in duplicate_tasks:
+        original = duplicates[inf_file]
+        result = file_results[original]
+        if result is False or result is None:
+            # Nothing was written for the original, let the copy report its own error
+            result = decompress_inf(inf_file, output_path, verbose=verbose, to_text=to_text)
+        else:
+            # Hardlinked or symlinked inputs converted in place share their output file
+            if not (os.path.exists(output_path) and os.path.samefile(output_paths[original], output_path)):
+                # Through write_file, so outputs that are already up to date are not rewritten
+                with open(output_paths[original], 'rb') as f:
+                    write_file(output_path, f.read())
+            print(f"  Duplicate: {os.path.basename(inf_file)} (same as {os.path.relpath(original, input_dir)})")
+        results.append(result)
+
+    for result in results:
         if result is True:
             stats['decompressed'] += 1
         elif result == 'converted':
@@ -1098,6 +1573,49 @@ def process_directory(input_dir, output_dir, verbose=False, in_place=False, to_t
     print(f"  Skipped: {stats['skipped']}")
 
 
+def analyze_file(data):
+    """Print the format and structure of an INF file's content (the -a option).
+
+    Args:
+        data: File content (bytes or a memory-mapped file)
+    """
+    magic = data[0:4]
+    version = get_version(magic)
+
+    if version is not None:
+        print(f"Compressed INF, version {version}")
+        print(f"Magic: {magic.hex()}")
+        compressed_size = _U32.unpack_from(data, 4)[0]
+        uncompressed_size = _U32.unpack_from(data, 8)[0]
+        print(f"Compressed size: {compressed_size}")
+        print(f"Uncompressed size: {uncompressed_size}")
+
+        try:
+            # Inflate from a view of the payload instead of a copy
+            with memoryview(data)[12:] as compressed_data:
+                decompressed = zlib.decompress(compressed_data)
+            print(f"\nDecompressed successfully ({len(decompressed)} bytes)")
+            info = analyze_binary_inf(decompressed)
+            if info:
+                print(f"String table offset: 0x{info['string_table_offset']:X}")
+                print(f"String count: {info.get('string_count', 'unknown')}")
+                if 'sample_strings' in info:
+                    print(f"\nStrings:")
+                    for i, s in enumerate(info['sample_strings']):
+                        print(f"  [{i}] {s}")
+        except Exception as e:
+            print(f"Decompression failed: {e}")
+    elif is_text_inf(data):
+        print("Text INF file")
+        print(data[:500].decode('utf-8', errors='replace'))
+    else:
+        print("Unknown format or already decompressed binary")
+        info = analyze_binary_inf(data)
+        if info:
+            print(f"String table offset: 0x{info['string_table_offset']:X}")
+            print(f"String count: {info.get('string_count', 'unknown')}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Decompress WarFront: Turning Point .inf files',
@@ -1130,43 +1648,13 @@ Examples:
     args = parser.parse_args()
 
     if args.analyze:
-        # Just analyze a file
+        # Just analyze a file, memory-mapped so it is not copied into memory
         with open(args.analyze, 'rb') as f:
-            data = f.read()
-
-        magic = data[0:4]
-        version = get_version(magic)
-
-        if version is not None:
-            print(f"Compressed INF, version {version}")
-            print(f"Magic: {magic.hex()}")
-            compressed_size = struct.unpack('<I', data[4:8])[0]
-            uncompressed_size = struct.unpack('<I', data[8:12])[0]
-            print(f"Compressed size: {compressed_size}")
-            print(f"Uncompressed size: {uncompressed_size}")
-
-            try:
-                decompressed = zlib.decompress(data[12:])
-                print(f"\nDecompressed successfully ({len(decompressed)} bytes)")
-                info = analyze_binary_inf(decompressed)
-                if info:
-                    print(f"String table offset: 0x{info['string_table_offset']:X}")
-                    print(f"String count: {info.get('string_count', 'unknown')}")
-                    if 'sample_strings' in info:
-                        print(f"\nStrings:")
-                        for i, s in enumerate(info['sample_strings']):
-                            print(f"  [{i}] {s}")
-            except Exception as e:
-                print(f"Decompression failed: {e}")
-        elif is_text_inf(data):
-            print("Text INF file")
-            print(data[:500].decode('utf-8', errors='replace'))
-        else:
-            print("Unknown format or already decompressed binary")
-            info = analyze_binary_inf(data)
-            if info:
-                print(f"String table offset: 0x{info['string_table_offset']:X}")
-                print(f"String count: {info.get('string_count', 'unknown')}")
+            if os.fstat(f.fileno()).st_size == 0:
+                analyze_file(b'')  # Empty files cannot be mapped
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    analyze_file(data)
 
     elif args.file:
         decompress_inf(args.file[0], args.file[1], verbose=True, to_text=args.to_text)